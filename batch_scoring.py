@@ -0,0 +1,87 @@
+"""NumPy-vectorized feedback scoring of guesses against many answers at once.
+
+Words are encoded as an N x 5 uint8 array of letter indices (a = 0) plus an
+N x 26 uint8 array of letter counts. The codes produced match
+feedback.score exactly, duplicate letters included: greens are taken
+first, then yellows are handed out left to right while unmatched copies
+of the letter remain in the answer.
+"""
+
+
+import numpy as np
+
+import feedback
+import words
+
+
+BLOCK_SIZE = 512
+
+_encoded_words = None
+
+
+def encode(word_list) -> tuple[np.ndarray, np.ndarray]:
+    word_list = [word.lower() for word in word_list]
+    if any(len(word) != 5 for word in word_list):
+        raise ValueError("can only score five-letter words made of a-z")
+    joined = "".join(word_list).encode("ascii", "replace")
+    letters = np.frombuffer(joined, dtype=np.uint8) - ord("a")
+    if np.any(letters >= 26):
+        raise ValueError("can only score five-letter words made of a-z")
+    letters = letters.reshape(-1, 5)
+    counts = np.zeros((len(letters), 26), dtype=np.uint8)
+    rows = np.arange(len(letters))
+    for position in range(5):
+        np.add.at(counts, (rows, letters[:, position]), 1)
+    return letters, counts
+
+
+def encoded_words() -> tuple[np.ndarray, np.ndarray]:
+    global _encoded_words # pylint: disable=global-statement
+    if _encoded_words is None:
+        _encoded_words = encode(words.WORDS)
+    return _encoded_words
+
+
+def score_encoded(guess_letters: np.ndarray,
+                  answer_letters: np.ndarray,
+                  answer_counts: np.ndarray) -> np.ndarray:
+    green = guess_letters[:, None, :] == answer_letters[None, :, :]
+    codes = np.zeros(green.shape[:2], dtype=np.uint8)
+    yellows = []
+
+    for position in range(5):
+        place = feedback.PLACES[position]
+        letter = guess_letters[:, position]
+        same_letter = guess_letters == letter[:, None]
+
+        #Copies of this letter in the answer not already claimed by a green
+        #anywhere or by a yellow further left:
+        available = answer_counts[:, letter].T.astype(np.int8)
+        available -= (green & same_letter[:, None, :]).sum(axis=2, dtype=np.int8)
+        for earlier in range(position):
+            available -= yellows[earlier] & same_letter[:, earlier, None]
+
+        yellow = ~green[:, :, position] & (available > 0)
+        yellows.append(yellow)
+        codes += green[:, :, position].astype(np.uint8) * np.uint8(feedback.CORRECT * place)
+        codes += yellow.astype(np.uint8) * np.uint8(feedback.WRONG_PLACE * place)
+
+    return codes
+
+
+def score_block(guesses, answers=None) -> np.ndarray:
+    if answers is None:
+        answer_letters, answer_counts = encoded_words()
+    else:
+        answer_letters, answer_counts = encode(answers)
+    guess_letters, _ = encode(guesses)
+
+    codes = np.empty((len(guess_letters), len(answer_letters)), dtype=np.uint8)
+    for start in range(0, len(guess_letters), BLOCK_SIZE):
+        stop = start + BLOCK_SIZE
+        codes[start:stop] = score_encoded(guess_letters[start:stop], answer_letters, answer_counts)
+    return codes
+
+
+def score_all(guess: str, answers=None) -> np.ndarray:
+    return score_block([guess], answers)[0]
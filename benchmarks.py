@@ -0,0 +1,216 @@
+"""Benchmark suite for the hot paths: validation, scoring, input handling and rendering.
+
+Runs offline on SDL's dummy video driver. Each benchmark is warmed up and
+then timed over several repeats of a batch of calls with garbage
+collection paused; results are reported per call as percentiles, can be
+written out as JSON and compared against a saved baseline, failing when a
+median slows down by more than the threshold.
+"""
+
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+import pygame
+
+import batch_scoring
+import feedback
+import headless
+import main as app
+import words
+
+
+ANSWER = "crane"
+GUESSES = ("raise", "cloth", "pudgy", "brink", "flame", "shown")
+#Six wrong guesses, so the scenario fills the whole board and loses.
+SIX_ROWS_SCRIPT = "".join(guess.upper() + "." for guess in GUESSES)
+NOT_WORDS = ("xqzvw", "aaaaa", "crnae", "zzzzz")
+DEFAULT_WARMUP = 3
+DEFAULT_REPEATS = 15
+DEFAULT_THRESHOLD = 0.10
+
+
+def bench_check_dictionary(screen: app.Screen):
+    guesses = [word.upper() for word in words.WORDS[::97]] + [word.upper() for word in NOT_WORDS]
+    def run():
+        for guess in guesses:
+            app.check_dictionary(guess)
+    return run, len(guesses)
+
+
+def bench_score(screen: app.Screen):
+    pairs = [(guess, answer) for guess in GUESSES for answer in words.WORDS[::193]]
+    def run():
+        for guess, answer in pairs:
+            feedback.score(guess, answer)
+    return run, len(pairs)
+
+
+def bench_test_guess(screen: app.Screen):
+    #Each call scores a first guess against a fresh keyboard.
+    def run():
+        for guess in GUESSES:
+            screen.game.new_game(ANSWER)
+            app.test_guess(screen, guess)
+    return run, len(GUESSES)
+
+
+def bench_batch_score_all(screen: app.Screen):
+    batch_scoring.encoded_words()
+    def run():
+        batch_scoring.score_all(GUESSES[0])
+    return run, 1
+
+
+def bench_handle_event(screen: app.Screen):
+    keys = [headless.key_event(key) for key in "RAISE<<<<<"]
+    def run():
+        screen.game.new_game(ANSWER)
+        for event in keys:
+            app.handle_event(screen, event)
+        screen.dirty_squares.clear()
+        screen.dirty_keys.clear()
+    return run, len(keys)
+
+
+def bench_draw_grid(screen: app.Screen):
+    screen.game.new_game(ANSWER)
+    headless.play(screen, SIX_ROWS_SCRIPT[:18])
+    def run():
+        app.draw_grid(screen)
+    return run, 1
+
+
+def bench_render_dirty(screen: app.Screen):
+    screen.game.new_game(ANSWER)
+    screen.full_redraw = True
+    app.render(screen)
+    def run():
+        screen.dirty_squares.add((0, 0))
+        app.render(screen)
+    return run, 1
+
+
+def bench_six_rows(screen: app.Screen):
+    def run():
+        screen.game.new_game(ANSWER)
+        screen.full_redraw = True
+        app.render(screen)
+        headless.play(screen, SIX_ROWS_SCRIPT)
+    return run, 1
+
+
+BENCHMARKS = {"check_dictionary": bench_check_dictionary,
+              "score": bench_score,
+              "test_guess": bench_test_guess,
+              "batch_score_all": bench_batch_score_all,
+              "handle_event": bench_handle_event,
+              "draw_grid": bench_draw_grid,
+              "render_dirty": bench_render_dirty,
+              "six_rows": bench_six_rows}
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(run, calls: int, warmup: int = DEFAULT_WARMUP, repeats: int = DEFAULT_REPEATS) -> dict:
+    for _ in range(warmup):
+        run()
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            started_at = time.perf_counter_ns()
+            run()
+            times.append((time.perf_counter_ns() - started_at) / calls / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    ordered = sorted(times)
+    return {"calls": calls,
+            "repeats": repeats,
+            "mean_us": float(np.mean(ordered)),
+            "min_us": ordered[0],
+            "p50_us": percentile(ordered, 0.5),
+            "p90_us": percentile(ordered, 0.9),
+            "p99_us": percentile(ordered, 0.99),
+            "max_us": ordered[-1]}
+
+
+def run_benchmarks(names: list[str], warmup: int = DEFAULT_WARMUP, repeats: int = DEFAULT_REPEATS) -> dict:
+    headless.setup()
+    screen = headless.new_screen(ANSWER)
+    results = {}
+    try:
+        for name in names:
+            run, calls = BENCHMARKS[name](screen)
+            results[name] = measure(run, calls, warmup, repeats)
+    finally:
+        screen.hints.close()
+    return {"python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "benchmarks": results}
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    changes = {}
+    for name, result in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+        ratio = result["p50_us"] / previous["p50_us"] if previous["p50_us"] else 1.0
+        changes[name] = {"ratio": ratio, "regressed": ratio > 1 + threshold}
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", metavar="benchmark",
+                        help="benchmarks to run (default all): " + ", ".join(BENCHMARKS))
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare the median of each benchmark against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown before failing, as a fraction (default 0.10)")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error("unknown benchmarks: " + ", ".join(unknown))
+
+    results = run_benchmarks(args.names or list(BENCHMARKS), args.warmup, args.repeats)
+    changes = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            changes = compare(results, json.load(file), args.threshold)
+
+    for name, result in results["benchmarks"].items():
+        line = f"{name:<18}{result['p50_us']:>12.2f} us p50{result['p90_us']:>12.2f} us p90" + \
+               f"{result['min_us']:>12.2f} us min"
+        if name in changes:
+            line += f"  {changes[name]['ratio']:.2f}x baseline" + \
+                    (" REGRESSED" if changes[name]["regressed"] else "")
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    regressions = [name for name, change in changes.items() if change["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}: " +
+              ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compact board state: one bytearray of letters and one of status codes.
+
+Squares are lightweight views into those arrays, so callers can keep using
+board[row][column].letter and .status while a reset only clears two
+bytearrays instead of allocating new objects.
+"""
+
+
+from feedback import Status
+
+
+ROWS = 6
+COLUMNS = 5
+
+#Status values are 0-4 in declaration order, so a code indexes this directly.
+STATUSES = tuple(Status)
+
+
+class Square:
+    __slots__ = ("board", "index")
+
+    def __init__(self, board: "Board" = None, index: int = 0):
+        self.board = board if board is not None else Board(1, 1)
+        self.index = index
+
+    @property
+    def letter(self) -> str:
+        code = self.board.letters[self.index]
+        return chr(code) if code else ""
+
+    @letter.setter
+    def letter(self, letter: str):
+        self.board.letters[self.index] = ord(letter) if letter else 0
+
+    @property
+    def status(self) -> Status:
+        return STATUSES[self.board.statuses[self.index]]
+
+    @status.setter
+    def status(self, status: Status):
+        self.board.statuses[self.index] = status.value
+
+
+class Board:
+    __slots__ = ("columns", "letters", "statuses", "rows")
+
+    def __init__(self, rows: int = ROWS, columns: int = COLUMNS):
+        self.columns = columns
+        self.letters = bytearray(rows * columns)
+        self.statuses = bytearray(rows * columns)
+        self.rows = [[Square(self, row * columns + column) for column in range(columns)]
+                     for row in range(rows)]
+
+    def __getitem__(self, row: int) -> list[Square]:
+        return self.rows[row]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def reset(self):
+        self.letters[:] = bytes(len(self.letters))
+        self.statuses[:] = bytes(len(self.statuses))
+
+    def row_word(self, row: int) -> str:
+        start = row * self.columns
+        return self.letters[start:start + self.columns].replace(b"\0", b"").decode("ascii")
+
+    def set_row_status(self, row: int, status: Status):
+        start = row * self.columns
+        self.statuses[start:start + self.columns] = bytes([status.value]) * self.columns
@@ -0,0 +1,48 @@
+"""Answers still consistent with the scored guesses, kept as a bitset over the word list."""
+
+
+import numpy as np
+
+import feedback
+import feedback_matrix
+import words
+
+
+class Candidate_Set:
+    def __init__(self, word_list=None):
+        self.word_list = words.WORDS if word_list is None else word_list
+        #Loaded up front so a cold build never lands on a keypress.
+        self.matrix = feedback_matrix.shared(self.word_list)
+        self.reset()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def reset(self):
+        self.bits = (1 << len(self.word_list)) - 1
+        self.count = len(self.word_list)
+
+    def indices(self):
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def words(self) -> list[str]:
+        return [self.word_list[index] for index in self.indices()]
+
+    def narrow(self, guess: str, code: int) -> int:
+        guess_index = self.matrix.positions.get(guess.lower())
+        if guess_index is None:
+            #Guesses outside the list have no matrix row, so rescore the survivors:
+            kept = 0
+            for index in self.indices():
+                if feedback.score(guess, self.word_list[index]) == code:
+                    kept |= 1 << index
+        else:
+            matches = np.frombuffer(self.matrix.row(guess_index), dtype=np.uint8) == code
+            kept = int.from_bytes(np.packbits(matches, bitorder="little").tobytes(), "little")
+        self.bits &= kept
+        self.count = self.bits.bit_count()
+        return self.count
@@ -0,0 +1,43 @@
+"""Hashed index over the word list for constant-time dictionary lookups."""
+
+
+from time import perf_counter_ns
+
+import words
+
+
+class Dictionary_Index:
+    def __init__(self, word_list):
+        self.positions = {word: i for i, word in enumerate(word_list)}
+        self.reset_stats()
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, word: str) -> bool:
+        start = perf_counter_ns()
+        found = word in self.positions
+        self.lookup_ns += perf_counter_ns() - start
+        self.lookups += 1
+        if found:
+            self.hits += 1
+        return found
+
+    def index(self, word: str) -> int:
+        return self.positions[word]
+
+    def reset_stats(self):
+        self.lookups = 0
+        self.hits = 0
+        self.lookup_ns = 0
+
+    def stats(self) -> dict:
+        mean_ns = self.lookup_ns / self.lookups if self.lookups else 0.0
+        return {"lookups": self.lookups,
+                "hits": self.hits,
+                "misses": self.lookups - self.hits,
+                "total_ns": self.lookup_ns,
+                "mean_ns": mean_ns}
+
+
+INDEX = Dictionary_Index(words.WORDS)
@@ -0,0 +1,44 @@
+"""Single-pass event dispatch: drain the whole queue once per frame and route by type."""
+
+
+import pygame
+
+
+class Event_Dispatcher:
+    def __init__(self):
+        self.handlers = {}
+        self.handled = 0
+        self.ignored = 0
+        self.dropped = 0
+        self.peak_batch = 0
+
+    def register(self, event_type: int, handler):
+        self.handlers[event_type] = handler
+
+    def install(self):
+        #Keep SDL from queueing anything nobody handles (mouse motion,
+        #text input, window events) so the queue cannot fill up.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.handlers))
+
+    def dispatch(self, event_batch) -> bool:
+        self.peak_batch = max(self.peak_batch, len(event_batch))
+        for i, event in enumerate(event_batch):
+            handler = self.handlers.get(event.type)
+            if handler is None:
+                self.ignored += 1
+                continue
+            self.handled += 1
+            if handler(event) is False:
+                self.dropped += len(event_batch) - i - 1
+                return False
+        return True
+
+    def dispatch_pending(self) -> bool:
+        return self.dispatch(pygame.event.get())
+
+    def stats(self) -> dict:
+        return {"handled": self.handled,
+                "ignored": self.ignored,
+                "dropped": self.dropped,
+                "peak_batch": self.peak_batch}
@@ -0,0 +1,74 @@
+"""Guess scoring and keyboard state, independent of the pygame front end.
+
+A feedback code packs the five per-letter results of a guess into one
+base-3 integer (0-242), with position i contributing digit * 3 ** i.
+"""
+
+
+from enum import Enum
+
+
+INCORRECT = 0
+WRONG_PLACE = 1
+CORRECT = 2
+PLACES = (1, 3, 9, 27, 81)
+ALL_CORRECT = 242
+CODE_COUNT = 243
+
+
+class Status(Enum):
+    INACTIVE = 0
+    NOT_TESTED = 1
+    INCORRECT = 2
+    WRONG_PLACE = 3
+    CORRECT = 4
+
+
+#Feedback digit -> Status; the Status values also rank keyboard priority.
+DIGIT_STATUSES = (Status.INCORRECT, Status.WRONG_PLACE, Status.CORRECT)
+
+
+def score(guess: str, answer: str) -> int:
+    code = 0
+    unmatched = {}
+    for i in range(5):
+        letter = answer[i]
+        if guess[i] == letter:
+            code += CORRECT * PLACES[i]
+        else:
+            unmatched[letter] = unmatched.get(letter, 0) + 1
+    if unmatched:
+        for i in range(5):
+            letter = guess[i]
+            if letter != answer[i] and unmatched.get(letter, 0) > 0:
+                unmatched[letter] -= 1
+                code += WRONG_PLACE * PLACES[i]
+    return code
+
+
+def digits(code: int) -> tuple[int, int, int, int, int]:
+    return (code % 3, code // 3 % 3, code // 9 % 3, code // 27 % 3, code // 81)
+
+
+def encode(digit_list) -> int:
+    code = 0
+    for i, digit in enumerate(digit_list):
+        code += digit * PLACES[i]
+    return code
+
+
+def correct_count(code: int) -> int:
+    return digits(code).count(CORRECT)
+
+
+def statuses(code: int) -> list[Status]:
+    return [DIGIT_STATUSES[digit] for digit in digits(code)]
+
+
+def reduce_keyboard(letters: dict, guess: str, code: int) -> dict:
+    letters = dict(letters)
+    for letter, digit in zip(guess.upper(), digits(code)):
+        status = DIGIT_STATUSES[digit]
+        if status.value > letters[letter].value:
+            letters[letter] = status
+    return letters
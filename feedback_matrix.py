@@ -0,0 +1,97 @@
+"""Precomputed guess x answer feedback codes, cached on disk and memory-mapped.
+
+Row g of the matrix holds feedback.score(words[g], words[a]) for every
+answer a as one uint8 per cell. The cache file sits next to the word pack
+and is named after a hash of the word list, so editing the list simply
+produces a new cache instead of serving stale codes.
+"""
+
+
+import hashlib
+import mmap
+import os
+import sys
+
+import batch_scoring
+import storage
+import words
+
+
+_shared_matrices = {}
+
+
+class Feedback_Matrix:
+    def __init__(self, data, word_list):
+        self.data = data
+        self.size = len(word_list)
+        self.positions = {word: index for index, word in enumerate(word_list)}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def code(self, guess_index: int, answer_index: int) -> int:
+        return self.data[guess_index * self.size + answer_index]
+
+    def row(self, guess_index: int) -> memoryview:
+        start = guess_index * self.size
+        return memoryview(self.data)[start:start + self.size]
+
+    def lookup(self, guess: str, answer: str) -> int:
+        return self.code(self.positions[guess.lower()], self.positions[answer.lower()])
+
+
+def list_digest(word_list) -> str:
+    return hashlib.sha256("".join(word_list).encode("ascii")).hexdigest()[:16]
+
+
+def matrix_path(word_list) -> str:
+    return os.path.join(storage.BASE_DIR, f"feedback-{list_digest(word_list)}.bin")
+
+
+def compute(word_list) -> bytes:
+    word_list = list(word_list)
+    return batch_scoring.score_block(word_list, word_list).tobytes()
+
+
+def build(word_list=None, path: str = None) -> str:
+    if word_list is None:
+        word_list = words.WORDS
+    if path is None:
+        path = matrix_path(word_list)
+    storage.write_atomic(path, compute(word_list))
+    return path
+
+
+def load(word_list=None, path: str = None) -> Feedback_Matrix:
+    if word_list is None:
+        word_list = words.WORDS
+    if path is None:
+        path = matrix_path(word_list)
+    size = len(word_list)
+    if not os.path.exists(path) or os.path.getsize(path) != size * size:
+        build(word_list, path)
+    with open(path, "rb") as matrix_file:
+        data = mmap.mmap(matrix_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Feedback_Matrix(data, word_list)
+
+
+def shared(word_list=None) -> Feedback_Matrix:
+    #One mapping per word list for the whole process, however many games use
+    #it. Entries hold on to their list, so its id cannot be reused while cached.
+    if word_list is None:
+        word_list = words.WORDS
+    cached = _shared_matrices.get(id(word_list))
+    if cached is not None and cached[0] is word_list:
+        return cached[1]
+    digest = list_digest(word_list)
+    matrix = next((matrix for _, matrix, cached_digest in _shared_matrices.values()
+                   if cached_digest == digest), None)
+    if matrix is None:
+        matrix = load(word_list)
+    _shared_matrices[id(word_list)] = (word_list, matrix, digest)
+    return matrix
+
+
+if __name__ == "__main__":
+    built_path = build(path=sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"Wrote {len(words.WORDS)}x{len(words.WORDS)} feedback matrix to {built_path}")
@@ -0,0 +1,128 @@
+"""Font objects constructed once per (family, size) and reused across redraws.
+
+Resolving a family name to a font file makes pygame scan the installed
+system fonts (fc-list on Linux), so resolved paths are also kept in a
+small JSON file keyed by the modification times of the font
+directories. Later launches reuse it and skip the scan until a font
+directory changes.
+"""
+
+
+import json
+import os
+import sys
+
+import pygame.freetype
+import pygame.sysfont
+
+import storage
+
+
+CACHE_PATH = os.path.join(storage.BASE_DIR, "fonts-cache.json")
+
+#Tried in order when a family is not installed; None is pygame's default font.
+FALLBACKS = {
+    "OCR-A Extended": ["OCR A Extended", "DejaVu Sans Mono", "Liberation Mono", "Courier New"],
+    "Trebuchet MS": ["DejaVu Sans", "Liberation Sans", "Arial"],
+    "Lucida Console": ["DejaVu Sans Mono", "Liberation Mono", "Consolas", "Courier New"],
+}
+
+
+def font_directories() -> list[str]:
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        windows_dir = os.environ.get("WINDIR", "C:\\Windows")
+        local_dir = os.environ.get("LOCALAPPDATA", home)
+        return [os.path.join(windows_dir, "Fonts"),
+                os.path.join(local_dir, "Microsoft", "Windows", "Fonts")]
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts")]
+
+
+def directory_stamp() -> dict:
+    stamp = {}
+    for directory in font_directories():
+        for path, _, _ in os.walk(directory):
+            stamp[path] = os.path.getmtime(path)
+    return stamp
+
+
+class Font_Resolver:
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.stamp = directory_stamp()
+        self.paths = {}
+        self.scanned = False
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if cached.get("stamp") == self.stamp:
+                self.paths = cached.get("paths", {})
+        except (OSError, ValueError):
+            pass
+
+    def resolve_all(self, families) -> list:
+        #The cache file is rewritten at most once per batch of families.
+        paths = [self.find(family) for family in families]
+        if self.dirty:
+            self.save()
+        return paths
+
+    def resolve(self, family: str):
+        return self.resolve_all([family])[0]
+
+    def find(self, family: str):
+        if family in self.paths:
+            path = self.paths[family]
+            if path is None or os.path.exists(path):
+                return path
+
+        self.scanned = True
+        path = None
+        for name in [family] + FALLBACKS.get(family, []):
+            path = pygame.sysfont.match_font(name)
+            if path is not None:
+                break
+        self.paths[family] = path
+        self.dirty = True
+        return path
+
+    def save(self):
+        try:
+            cached = {"stamp": self.stamp, "paths": self.paths}
+            storage.write_atomic(self.path, json.dumps(cached).encode("utf-8"))
+            self.dirty = False
+        except OSError:
+            pass
+
+
+class Font_Cache:
+    def __init__(self, scale: float, resolver: Font_Resolver = None, families=()):
+        self.scale = scale
+        self.resolver = resolver if resolver is not None else Font_Resolver()
+        self.resolver.resolve_all(families)
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, family: str, size: float) -> pygame.freetype.Font:
+        key = (family, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = pygame.freetype.Font(self.resolver.resolve(family), size * self.scale)
+            self.fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def set_scale(self, scale: float):
+        if scale != self.scale:
+            self.scale = scale
+            self.fonts.clear()
+
+    def stats(self) -> dict:
+        return {"fonts": len(self.fonts), "hits": self.hits, "misses": self.misses}
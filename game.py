@@ -0,0 +1,159 @@
+"""Game rules without pygame: typing, deleting, submitting, win/loss and keyboard state.
+
+The front end (or a server, simulator or test) feeds letters and keys in
+and reads the board, keyboard and message back out. Squares and keyboard
+letters touched since the last drain_changes() are recorded so a renderer
+can repaint just those.
+"""
+
+
+from enum import Enum
+
+import board
+import candidates
+import dictionary
+import feedback
+from feedback import Status
+
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class Validation_State(Enum):
+    TOO_LONG = 0
+    TOO_SHORT = 1
+    NOT_IN_DICTIONARY = 2
+    VALID = 3
+
+
+class Game_State(Enum):
+    IN_GAME = 0
+    OUT_OF_GAME = 1
+
+
+def check_dictionary(guess: str) -> bool:
+    if guess.lower() in dictionary.INDEX:
+        return True
+    return False
+
+
+def guess_validation(guess: str) -> Validation_State:
+    if not check_dictionary(guess):
+        return Validation_State.NOT_IN_DICTIONARY
+
+    return Validation_State.VALID
+
+
+class Game:
+    def __init__(self, word: str = "", track_candidates: bool = False):
+        self.board = board.Board()
+        self.candidates = candidates.Candidate_Set() if track_candidates else None
+        self.changed_squares = set()
+        self.changed_letters = set()
+        self.new_game(word)
+
+    def new_game(self, word: str):
+        self.word = word.lower()
+        self.board.reset()
+        self.board.set_row_status(0, Status.NOT_TESTED)
+        self.letters = dict.fromkeys(ALPHABET, Status.NOT_TESTED)
+        if self.candidates is not None:
+            self.candidates.reset()
+        self.active_row = 0
+        self.active_column = 0
+        self.state = Game_State.IN_GAME
+        self.message = "Start typing to begin"
+        self.changed_squares.clear()
+        self.changed_letters.clear()
+
+    def drain_changes(self) -> tuple[set, set]:
+        changes = (set(self.changed_squares), set(self.changed_letters))
+        self.changed_squares.clear()
+        self.changed_letters.clear()
+        return changes
+
+    def mark_row(self, row: int):
+        for column in range(board.COLUMNS):
+            self.changed_squares.add((row, column))
+
+    def row_message(self) -> str:
+        message = "Guess #" + str(self.active_row + 1)
+        if self.active_row > 0 and self.candidates is not None:
+            remaining = len(self.candidates)
+            message += " - " + str(remaining) + (" word remains" if remaining == 1 else " words remain")
+        return message
+
+    def current_square(self) -> board.Square:
+        return self.board[self.active_row][self.active_column]
+
+    def type_letter(self, letter: str) -> bool:
+        if self.state != Game_State.IN_GAME or self.current_square().letter != "":
+            return False
+        self.current_square().letter = letter.upper()
+        self.changed_squares.add((self.active_row, self.active_column))
+        if self.active_column < board.COLUMNS - 1:
+            self.active_column += 1
+        self.message = self.row_message()
+        return True
+
+    def backspace(self) -> bool:
+        if self.state != Game_State.IN_GAME:
+            return False
+        if self.active_column >= 1 and self.current_square().letter == "":
+            self.active_column -= 1
+        self.current_square().letter = ""
+        self.changed_squares.add((self.active_row, self.active_column))
+        self.message = self.row_message()
+        return True
+
+    def score_code(self, guess: str) -> int:
+        guess = guess.lower()
+        code = feedback.score(guess, self.word)
+        self.letters = feedback.reduce_keyboard(self.letters, guess, code)
+        self.changed_letters.update(guess.upper())
+        return code
+
+    def score_guess(self, guess: str) -> tuple[list[Status], int]:
+        code = self.score_code(guess)
+        return feedback.statuses(code), feedback.correct_count(code)
+
+    def submit(self) -> Validation_State | None:
+        if self.state != Game_State.IN_GAME or self.current_square().letter == "":
+            return None
+
+        row = self.active_row
+        guess = self.board.row_word(row)
+        self.mark_row(row)
+        validation_state = guess_validation(guess)
+        if validation_state == Validation_State.VALID:
+            code = self.score_code(guess)
+            #Only submitted rows narrow the candidates, not every scoring call.
+            if self.candidates is not None:
+                self.candidates.narrow(guess.lower(), code)
+            statuses, correct_letter_amount = feedback.statuses(code), feedback.correct_count(code)
+            for square, status in zip(self.board[row], statuses):
+                square.status = status
+
+            if correct_letter_amount == board.COLUMNS:
+                self.message = "Correct! You win!"
+                self.state = Game_State.OUT_OF_GAME
+            elif row < board.ROWS - 1:
+                self.active_column = 0
+                self.active_row += 1
+                self.board.set_row_status(self.active_row, Status.NOT_TESTED)
+                self.mark_row(self.active_row)
+                self.message = self.row_message()
+            else:
+                self.message = "You lost! The word was: " + self.word.upper()
+                self.state = Game_State.OUT_OF_GAME
+        elif validation_state == Validation_State.NOT_IN_DICTIONARY:
+            for square in self.board[row]:
+                square.letter = ""
+            self.board.set_row_status(row, Status.NOT_TESTED)
+            self.active_column = 0
+            self.message = "Word not in dictionary. Try again"
+        return validation_state
+
+    def is_won(self) -> bool:
+        return self.state == Game_State.OUT_OF_GAME and \
+               all(square.status == Status.CORRECT for square in self.board[self.active_row])
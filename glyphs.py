@@ -0,0 +1,39 @@
+"""Pre-rendered letter surfaces so redraws blit instead of rasterizing text."""
+
+
+import pygame
+import pygame.freetype
+
+
+class Glyph_Atlas:
+    def __init__(self, font: pygame.freetype.Font, letters: str, colors, background=None):
+        self.glyphs = {}
+        for color in colors:
+            for letter in letters:
+                surface, rect = font.render(letter, color, background)
+                self.glyphs[(letter, color)] = (surface, (rect.width / 2, rect.height / 2))
+
+    def __len__(self) -> int:
+        return len(self.glyphs)
+
+    def blit(self, target: pygame.Surface, letter: str, color: str, anchor: tuple[float, float]):
+        if letter == "":
+            return
+        surface, (half_w, half_h) = self.glyphs[(letter, color)]
+        target.blit(surface, (anchor[0] - half_w, anchor[1] - half_h))
+
+
+class Text_Cache:
+    def __init__(self, limit: int = 32):
+        self.limit = limit
+        self.surfaces = {}
+
+    def render(self, font: pygame.freetype.Font, text: str, color: str, background=None):
+        key = (id(font), text, color, background)
+        rendered = self.surfaces.get(key)
+        if rendered is None:
+            if len(self.surfaces) >= self.limit:
+                self.surfaces.clear()
+            rendered = font.render(text, color, background)
+            self.surfaces[key] = rendered
+        return rendered
@@ -0,0 +1,140 @@
+"""Headless rendering: drive the renderer from scripted input on SDL's dummy video driver.
+
+A script is a string of keys: letters type, "." (or a newline) submits the
+row and "<" (or a backspace) deletes. Every key is applied through
+handle_event and followed by one render, which is timed; frames can be
+written out as PNGs and compared against a reference directory.
+"""
+
+
+import argparse
+import os
+import statistics
+import time
+
+import numpy as np
+import pygame
+
+import main as app
+
+
+DEFAULT_ANSWER = "crane"
+DEFAULT_SCRIPT = "RAISE.XQZVW.<<<<<CLOTH.TRACE.CRANE."
+SUBMIT_KEYS = ".\n"
+DELETE_KEYS = "<\b"
+
+
+def setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init() # pylint: disable=no-member
+
+
+def key_event(key: str) -> pygame.event.Event:
+    if key in SUBMIT_KEYS:
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, scancode=40) # pylint: disable=no-member
+    if key in DELETE_KEYS:
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, scancode=42) # pylint: disable=no-member
+    letter = key.upper()
+    return pygame.event.Event(pygame.KEYDOWN, key=ord(letter.lower()), # pylint: disable=no-member
+                              scancode=4 + app.ALPHABET.index(letter))
+
+
+def new_screen(answer: str = DEFAULT_ANSWER, scale: float = 1.0, base_render: bool = False) -> app.Screen:
+    screen = app.Screen(base_render=base_render, scale=scale)
+    screen.word = answer.lower()
+    app.render(screen)
+    return screen
+
+
+def play(screen: app.Screen, script: str, on_frame=None) -> list[float]:
+    render_times = []
+    for key in script:
+        app.handle_event(screen, key_event(key))
+        started_at = time.perf_counter()
+        app.render(screen)
+        render_times.append(time.perf_counter() - started_at)
+        if on_frame is not None:
+            on_frame(len(render_times) - 1, screen)
+    return render_times
+
+
+def summarize(times: list[float]) -> dict:
+    ordered = sorted(times)
+    return {"frames": len(ordered),
+            "mean_ms": statistics.fmean(ordered) * 1000,
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "max_ms": ordered[-1] * 1000}
+
+
+def frame_name(index: int) -> str:
+    return f"frame_{index:03d}.png"
+
+
+def save_frame(screen: app.Screen, directory: str, index: int):
+    pygame.image.save(screen.window, os.path.join(directory, frame_name(index)))
+
+
+def frame_pixels(surface: pygame.Surface) -> np.ndarray:
+    return np.frombuffer(pygame.image.tobytes(surface, "RGB"), dtype=np.uint8).reshape(-1, 3)
+
+
+def compare_frames(directory: str, reference: str) -> dict:
+    differences = {}
+    for name in sorted(os.listdir(reference)):
+        if not name.endswith(".png"):
+            continue
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            differences[name] = -1
+            continue
+        expected = pygame.image.load(os.path.join(reference, name))
+        actual = pygame.image.load(path)
+        if expected.get_size() != actual.get_size():
+            differences[name] = -1
+            continue
+        changed = int(np.any(frame_pixels(expected) != frame_pixels(actual), axis=1).sum())
+        if changed:
+            differences[name] = changed
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answer", default=DEFAULT_ANSWER)
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--base-render", action="store_true")
+    parser.add_argument("--repeat", type=int, default=20, help="times to replay the script for timing")
+    parser.add_argument("--frames", help="directory to write one PNG per frame to")
+    parser.add_argument("--compare", help="reference frame directory to diff --frames against")
+    args = parser.parse_args()
+    if args.compare and not args.frames:
+        parser.error("--compare needs --frames")
+
+    setup()
+    render_times = []
+    for repeat in range(args.repeat):
+        screen = new_screen(args.answer, args.scale, args.base_render)
+        on_frame = None
+        if args.frames and repeat == 0:
+            os.makedirs(args.frames, exist_ok=True)
+            on_frame = lambda index, screen: save_frame(screen, args.frames, index)
+        render_times += play(screen, args.script, on_frame)
+        screen.hints.close()
+
+    summary = summarize(render_times)
+    print(f"{summary['frames']} frames: mean {summary['mean_ms']:.3f} ms, "
+          f"p50 {summary['p50_ms']:.3f} ms, p95 {summary['p95_ms']:.3f} ms, "
+          f"max {summary['max_ms']:.3f} ms")
+
+    if args.compare:
+        differences = compare_frames(args.frames, args.compare)
+        for name, changed in differences.items():
+            print(f"{name}: " + ("missing or resized" if changed < 0 else f"{changed} pixels differ"))
+        print("Frames match reference" if not differences else f"{len(differences)} frames differ")
+        raise SystemExit(1 if differences else 0)
+
+
+if __name__ == "__main__":
+    main()
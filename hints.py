@@ -0,0 +1,79 @@
+"""Background hint computation, posted back to the pygame loop as a custom event."""
+
+
+import queue
+import threading
+import time
+
+import pygame
+
+import solver
+
+
+HINT_READY = pygame.event.custom_type()
+
+
+class Hint_Worker:
+    def __init__(self):
+        self.generation = 0
+        self.requests = queue.Queue()
+        self.solver = None
+        self.thread = threading.Thread(target=self.run, name="hint-worker", daemon=True)
+        self.thread.start()
+
+    def request(self, candidate_indices) -> int:
+        self.generation += 1
+        self.requests.put((self.generation, list(candidate_indices), time.perf_counter()))
+        return self.generation
+
+    def cancel(self):
+        self.generation += 1
+
+    def close(self):
+        self.cancel()
+        self.requests.put(None)
+        self.thread.join(timeout=1)
+        self.reset_solver()
+
+    def is_stale(self, generation: int) -> bool:
+        return generation != self.generation
+
+    def run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            generation, candidate_indices, requested_at = request
+            if self.is_stale(generation):
+                continue
+            try:
+                if self.solver is None:
+                    self.solver = solver.Solver()
+                ranking = self.solver.rank(candidate_indices, 1,
+                                           should_stop=lambda: self.is_stale(generation)) # pylint: disable=cell-var-from-loop
+            except Exception as error: # pylint: disable=broad-exception-caught
+                #Report the failure instead of letting the thread die, and start
+                #from a fresh solver on the next request.
+                self.reset_solver()
+                self.post(generation, None, 0.0, requested_at, f"{type(error).__name__}: {error}")
+                continue
+            if not ranking or self.is_stale(generation):
+                continue
+            word, entropy = ranking[0]
+            self.post(generation, word, entropy, requested_at)
+
+    def post(self, generation: int, word: str, entropy: float, requested_at: float, error: str = None):
+        pygame.event.post(pygame.event.Event(HINT_READY,
+                                             generation=generation,
+                                             word=word,
+                                             entropy=entropy,
+                                             requested_at=requested_at,
+                                             error=error))
+
+    def reset_solver(self):
+        if self.solver is not None:
+            try:
+                self.solver.close()
+            except Exception: # pylint: disable=broad-exception-caught
+                pass
+            self.solver = None
@@ -0,0 +1,72 @@
+"""Window geometry for one scale: every grid and key rect, text anchors and the caption band.
+
+Sizes are given in base pixels (for a 1080 px tall desktop) and multiplied
+by the scale once, when the layout is built.
+"""
+
+
+import pygame
+
+
+GRID_ROWS = 6
+GRID_COLUMNS = 5
+KEYBOARD_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+CAPTION_Y = 600
+KEYBOARD_Y = 634
+
+
+def center(rect: pygame.Rect) -> tuple[float, float]:
+    return (rect.left + rect.width / 2, rect.top + rect.height / 2)
+
+
+class Layout:
+    def __init__(self, scale: float, width: int):
+        self.scale = scale
+        self.width = width
+
+        square_size = 88 * scale
+        screen_edge = 10 * scale
+        hor_square_margin = 10 * scale
+        ver_square_margin = 10 * scale
+        self.squares = [[pygame.Rect(
+                            column * (square_size + hor_square_margin) + screen_edge,
+                            row * (square_size + ver_square_margin) + screen_edge,
+                            square_size,
+                            square_size)
+                         for column in range(GRID_COLUMNS)]
+                        for row in range(GRID_ROWS)]
+        self.square_anchors = [[center(rect) for rect in row] for row in self.squares]
+
+        key_size = 42 * scale
+        start_y = KEYBOARD_Y * scale
+        hor_screen_edge = 8 * scale
+        hor_key_margin = 7 * scale
+        ver_key_margin = 7 * scale
+        row_margin = 8 * scale
+        self.keys = {}
+        for row, letters in enumerate(KEYBOARD_ROWS):
+            for column, letter in enumerate(letters):
+                self.keys[letter] = pygame.Rect(
+                    hor_screen_edge + column * (key_size + hor_key_margin) + row * row_margin,
+                    start_y + row * (key_size + ver_key_margin),
+                    key_size,
+                    key_size)
+        self.key_anchors = {letter: center(rect) for letter, rect in self.keys.items()}
+
+        self.caption_rect = pygame.Rect(0, CAPTION_Y * scale, width, (KEYBOARD_Y - CAPTION_Y) * scale)
+        self.caption_anchor = (0 + width / 2, CAPTION_Y * scale)
+        self.debug_origin = (2 * scale, 2 * scale)
+        self.debug_line_height = 14 * scale
+
+    def square_at(self, position) -> tuple[int, int]:
+        for row, rects in enumerate(self.squares):
+            for column, rect in enumerate(rects):
+                if rect.collidepoint(position):
+                    return row, column
+        return None
+
+    def key_at(self, position) -> str:
+        for letter, rect in self.keys.items():
+            if rect.collidepoint(position):
+                return letter
+        return None
@@ -1,191 +1,231 @@
 """Wordle application."""
 
 
-from enum import Enum
 from random import randrange
 import ctypes
+import math
+import sys
+import time
 
 import pygame
 import pygame.freetype
 
+import events
+import fonts
+import game
+import glyphs
+import hints
+import layout
 import words
+from board import Square
+from feedback import Status
+from game import ALPHABET, Game_State, Validation_State, check_dictionary, guess_validation # pylint: disable=unused-import
 
 
-ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 BASE_H = 1080
 WIN_W = 500
 WIN_H = 782
+RESIZE_DEBOUNCE_MS = 250
 BG_COLOR = "black"
 INACTIVE_COLOR = "grey"
 NOT_TESTED_COLOR = "white"
 INCORRECT_COLOR = "red"
 WRONG_PLACE_COLOR = "yellow"
 CORRECT_COLOR = "green"
+STATUS_COLORS = [INACTIVE_COLOR, NOT_TESTED_COLOR, INCORRECT_COLOR, WRONG_PLACE_COLOR, CORRECT_COLOR]
+#Resolved together at startup so the font cache file is written once.
+FONT_FAMILIES = ["OCR-A Extended", "Trebuchet MS", "Lucida Console"]
 
 
-class Status(Enum):
-    INACTIVE = 0
-    NOT_TESTED = 1
-    INCORRECT = 2
-    WRONG_PLACE = 3
-    CORRECT = 4
+class Screen:
+    def __init__(self, base_render: bool = False, scale: float = None):
+        self.scale_mode: int
+        self.desktop_h = pygame.display.Info().current_h
+        self.scale = scale if scale is not None else pygame.display.Info().current_h / BASE_H
+        self.window = pygame.display.set_mode((WIN_W * self.scale, WIN_H * self.scale),
+                                              pygame.RESIZABLE) # pylint: disable=no-member
+        #With base_render everything is drawn at 1x into an off-screen canvas
+        #and scaled to the window once per frame, so the layout, fonts and
+        #glyphs are the same whatever the display size.
+        self.base_render = base_render
+        if base_render:
+            self.render_scale = 1
+            self.surface = pygame.Surface((WIN_W, WIN_H), 0, self.window)
+        else:
+            self.render_scale = self.scale
+            self.surface = self.window
+        self.view_size = self.window.get_size()
+        self.pending_size = None
+        self.resize_started_at = 0.0
+        self.resize_settles_at = 0.0
+        self.resize_events = 0
+        self.fonts = fonts.Font_Cache(self.render_scale, families=FONT_FAMILIES)
+        self.build_caches()
+        self.game = game.Game(track_candidates=True)
+        self.hints = hints.Hint_Worker()
+        self.show_debug = False
+        self.debug = {}
+        self.dirty_squares = set()
+        self.dirty_keys = set()
+        self.drawn_caption = None
+        self.full_redraw = True
+
+    def build_caches(self):
+        self.layout = layout.Layout(self.render_scale, self.surface.get_width())
+        self.fonts.set_scale(self.render_scale)
+        self.build_glyphs()
+        self.background = build_background(self)
+        self.full_redraw = True
+
+    def resize(self, size: tuple[int, int]):
+        if self.window.get_size() != size:
+            self.window = pygame.display.set_mode(size, pygame.RESIZABLE) # pylint: disable=no-member
+        else:
+            self.window = pygame.display.get_surface()
+        self.scale = min(size[0] / WIN_W, size[1] / WIN_H)
+        self.view_size = (min(int(WIN_W * self.scale), size[0]), min(int(WIN_H * self.scale), size[1]))
+        if self.base_render:
+            #The 1x caches do not depend on the window size.
+            self.full_redraw = True
+        else:
+            self.render_scale = self.scale
+            self.surface = self.window
+            self.window.fill(BG_COLOR)
+            self.build_caches()
+
+    def build_glyphs(self):
+        self.grid_glyphs = glyphs.Glyph_Atlas(
+            self.fonts.get("OCR-A Extended", 36), ALPHABET, STATUS_COLORS, BG_COLOR)
+        self.key_glyphs = glyphs.Glyph_Atlas(
+            self.fonts.get("Trebuchet MS", 18), ALPHABET, STATUS_COLORS[1:])
+        self.text_cache = glyphs.Text_Cache()
 
+    def initiate_window(self):
+        self.game.new_game(self.game.word)
+        self.full_redraw = True
 
-class Validation_State(Enum):
-    TOO_LONG = 0
-    TOO_SHORT = 1
-    NOT_IN_DICTIONARY = 2
-    VALID = 3
+    #The game state lives in self.game; these keep the old Screen attributes working.
+    @property
+    def grid(self):
+        return self.game.board
 
+    @property
+    def letters(self) -> dict:
+        return self.game.letters
 
-class Game_State(Enum):
-    IN_GAME = 0
-    OUT_OF_GAME = 1
+    @letters.setter
+    def letters(self, letters: dict):
+        self.game.letters = letters
 
+    @property
+    def word(self) -> str:
+        return self.game.word
 
-class Square:
-    def __init__(self):
-        self.status = Status.INACTIVE
-        self.letter = ""
+    @word.setter
+    def word(self, word: str):
+        self.game.word = word.lower()
 
+    @property
+    def caption(self) -> str:
+        return self.game.message
 
-class Screen:
-    def __init__(self):
-        self.scale_mode: int
-        self.desktop_h = pygame.display.Info().current_h
-        self.scale = pygame.display.Info().current_h / BASE_H
-        self.window = pygame.display.set_mode((WIN_W * self.scale, WIN_H * self.scale))
-        self.letters = {}
-        for letter in ALPHABET:
-            self.letters.update({letter:Status.NOT_TESTED})
-        self.word = ""
-        self.initiate_window()
+    @caption.setter
+    def caption(self, caption: str):
+        self.game.message = caption
 
-    def initiate_window(self):
-        self.grid = [[Square(), Square(), Square(), Square(), Square()],
-                     [Square(), Square(), Square(), Square(), Square()],
-                     [Square(), Square(), Square(), Square(), Square()],
-                     [Square(), Square(), Square(), Square(), Square()],
-                     [Square(), Square(), Square(), Square(), Square()],
-                     [Square(), Square(), Square(), Square(), Square()]]
-        self.caption = "Start typing to begin"
-        for square in  self.grid[0]:
-            square.status = Status.NOT_TESTED
-        self.active_row = 0
-        self.active_column = 0
-        self.state = Game_State.IN_GAME
+    @property
+    def candidates(self):
+        return self.game.candidates
+
+    @property
+    def active_row(self) -> int:
+        return self.game.active_row
+
+    @property
+    def active_column(self) -> int:
+        return self.game.active_column
+
+    @property
+    def state(self) -> Game_State:
+        return self.game.state
 
 
 def handle_event(screen: Screen, event: pygame.event.Event):
-    if screen.state == Game_State.OUT_OF_GAME:
-        screen.initiate_window()
+    if screen.game.state == Game_State.OUT_OF_GAME:
         new_word(screen)
-        screen.letters = {}
-        for letter in ALPHABET:
-            screen.letters.update({letter:Status.NOT_TESTED})
-        draw_grid(screen)
+        screen.hints.cancel()
+        screen.full_redraw = True
     else:
         #Check if key pressed is in English alphabet:
         if event.scancode >= 4 and \
-           event.scancode <= 29 and \
-           screen.grid[screen.active_row][screen.active_column].letter == "":
-            screen.grid[screen.active_row][screen.active_column].letter = ALPHABET[event.scancode-4]
-            if screen.active_column <= 3:
-                screen.active_column += 1
-            screen.caption = "Guess #" + str(screen.active_row + 1)
-            draw_grid(screen)
+           event.scancode <= 29:
+            screen.game.type_letter(ALPHABET[event.scancode-4])
         #Check for backspace:
         elif event.key == pygame.K_BACKSPACE: # pylint: disable=no-member
-            if screen.active_column >= 1 and \
-               screen.grid[screen.active_row][screen.active_column].letter == "":
-                screen.active_column -= 1
-            screen.grid[screen.active_row][screen.active_column].letter = ""
-            screen.caption = "Guess #" + str(screen.active_row + 1)
-            draw_grid(screen)
+            screen.game.backspace()
+        #Check for hint request:
+        elif event.key == pygame.K_TAB: # pylint: disable=no-member
+            screen.hints.request(screen.candidates.indices())
+            screen.caption = "Thinking..."
+        #Check for debug overlay toggle:
+        elif event.key == pygame.K_F3: # pylint: disable=no-member
+            screen.show_debug = not screen.show_debug
+            screen.full_redraw = True
         #Check for enter:
-        elif event.key == pygame.K_RETURN and \
-             screen.grid[screen.active_row][screen.active_column].letter != "": # pylint: disable=no-member
-            guess: str = ""
-            for square in screen.grid[screen.active_row]:
-                guess += square.letter
-            validation_state = guess_validation(guess)
-            if validation_state == Validation_State.VALID:
-                statuses, correct_letter_amount = test_guess(screen, guess)
-
-                i = 0
-                for square in screen.grid[screen.active_row]:
-                    square.status = statuses[i]
-                    i += 1
-
-                if correct_letter_amount == 5:
-                    screen.caption = "Correct! You win!"
-                    screen.state = Game_State.OUT_OF_GAME
-                elif screen.active_row <= 4:
-                    screen.active_column = 0
-                    screen.active_row += 1
-
-                    for square in screen.grid[screen.active_row]:
-                        square.status = Status.NOT_TESTED
-                    screen.caption = "Guess #" + str(screen.active_row + 1)
-                else:
-                    screen.caption = "You lost! The word was: " + screen.word.upper()
-                    screen.state = Game_State.OUT_OF_GAME
-            elif validation_state == Validation_State.NOT_IN_DICTIONARY:
-                for square in screen.grid[screen.active_row]:
-                    square.letter = ""
-                    square.status = Status.NOT_TESTED
-
-                screen.active_column = 0
+        elif event.key == pygame.K_RETURN: # pylint: disable=no-member
+            if screen.game.submit() == Validation_State.VALID:
+                screen.hints.cancel()
+    mark_changes(screen)
 
-                screen.caption = "Word not in dictionary. Try again"
-            draw_grid(screen)
 
+def mark_changes(screen: Screen):
+    squares, letters = screen.game.drain_changes()
+    screen.dirty_squares.update(squares)
+    screen.dirty_keys.update(letters)
 
-def check_dictionary(guess: str) -> bool:
-    if guess.lower() in words.WORDS:
-        return True
-    return False
 
-
-def guess_validation(guess: str) -> Validation_State:
-    if not check_dictionary(guess):
-        return Validation_State.NOT_IN_DICTIONARY
-
-    return Validation_State.VALID
+def handle_hint(screen: Screen, event: pygame.event.Event):
+    if screen.hints.is_stale(event.generation):
+        return
+    latency = time.perf_counter() - event.requested_at
+    if event.word is None:
+        screen.debug["hint"] = f"hint failed after {latency * 1000:.1f} ms: {event.error}"
+        screen.caption = "Hint unavailable"
+    else:
+        screen.debug["hint"] = f"hint {latency * 1000:.1f} ms ({event.entropy:.2f} bits)"
+        screen.caption = "Hint: " + event.word.upper()
+    #The overlay text changed under grid squares, so repaint everything:
+    if screen.show_debug:
+        screen.full_redraw = True
+
+
+def handle_resize(screen: Screen, event: pygame.event.Event):
+    if screen.pending_size is None:
+        if (event.w, event.h) == screen.window.get_size() and \
+           min(event.w / WIN_W, event.h / WIN_H) == screen.scale:
+            return
+        screen.resize_started_at = time.perf_counter()
+        screen.resize_events = 0
+    screen.pending_size = (event.w, event.h)
+    screen.resize_events += 1
+    screen.resize_settles_at = time.perf_counter() + RESIZE_DEBOUNCE_MS / 1000
+
+
+def settle_resize(screen: Screen):
+    #Rebuild only once the window has stopped changing size.
+    if screen.pending_size is None or time.perf_counter() < screen.resize_settles_at:
+        return
+    rebuild_started_at = time.perf_counter()
+    screen.resize(screen.pending_size)
+    rebuild_ms = (time.perf_counter() - rebuild_started_at) * 1000
+    screen.debug["resize"] = f"resize {screen.resize_events} events, " + \
+        f"rebuild {rebuild_ms:.1f} ms, settled after " + \
+        f"{(rebuild_started_at - screen.resize_started_at) * 1000:.0f} ms"
+    screen.pending_size = None
 
 
 def test_guess(screen: Screen, guess: str) -> tuple[list[Status], int]:
-    guess = guess.lower()
-    statuses = [Status.NOT_TESTED] * 5
-    correct_letters = 0
-    temp_word = screen.word
-
-    for i in range(5):
-        if guess[i] == screen.word[i]:
-            statuses[i] = Status.CORRECT
-            screen.letters[guess[i].upper()] = Status.CORRECT
-            correct_letters += 1
-            temp_word = temp_word.replace(screen.word[i], "", 1)
-    for i in range(5):
-        if screen.word.count(guess[i]) > 0:
-            if statuses[i] != Status.CORRECT:
-                if guess[i] in temp_word:
-                    statuses[i] = Status.WRONG_PLACE
-                    if screen.letters[guess[i].upper()] != Status.CORRECT:
-                        screen.letters[guess[i].upper()] = Status.WRONG_PLACE
-                    temp_word = temp_word.replace(guess[i], "", 1)
-                else:
-                    statuses[i] = Status.INCORRECT
-                    if screen.letters[guess[i].upper()] != Status.CORRECT and \
-                       screen.letters[guess[i].upper()] != Status.WRONG_PLACE:
-                        screen.letters[guess[i].upper()] = Status.INCORRECT
-        else:
-            statuses[i] = Status.INCORRECT
-            if screen.letters[guess[i].upper()] != Status.CORRECT and \
-               screen.letters[guess[i].upper()] != Status.WRONG_PLACE:
-                screen.letters[guess[i].upper()] = Status.INCORRECT
-
-    return statuses, correct_letters
+    return screen.game.score_guess(guess)
 
 
 def get_letter_color(screen: Screen, letter: str) -> str:
@@ -199,109 +239,208 @@ def get_letter_color(screen: Screen, letter: str) -> str:
         return NOT_TESTED_COLOR
 
 
-def draw_keyboard(screen: Screen, start_y: int):
-    square_size = 42 * screen.scale
-    font_size = 18 * screen.scale
-    hor_screen_edge = 8 * screen.scale
-    hor_square_margin = 7 * screen.scale
-    ver_square_margin = 7 * screen.scale
-    row_margin = 8 * screen.scale
+def get_square_color(square: Square) -> str:
+    return STATUS_COLORS[square.status.value]
 
-    rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
 
-    def draw_character(row: int, column: int, letter: str):
-        fg_color = get_letter_color(screen, letter)
-        square_font = pygame.freetype.SysFont("Trebuchet MS", font_size)
+def build_background(screen: Screen) -> pygame.Surface:
+    #Everything that looks the same in every untouched square and key:
+    background = pygame.Surface(screen.surface.get_size(), 0, screen.surface)
+    background.fill(BG_COLOR)
+    for rects in screen.layout.squares:
+        for rect in rects:
+            pygame.draw.rect(background, INACTIVE_COLOR, rect, 1)
+    for letter, rect in screen.layout.keys.items():
+        pygame.draw.rect(background, NOT_TESTED_COLOR, rect, 1)
+        screen.key_glyphs.blit(background, letter, NOT_TESTED_COLOR, screen.layout.key_anchors[letter])
+    return background
 
-        square_rect = pygame.Rect(
-            hor_screen_edge + column * (square_size + hor_square_margin) + row * row_margin,
-            start_y + row * (square_size + ver_square_margin),
-            square_size,
-            square_size)
-        pygame.draw.rect(screen.window, fg_color, square_rect, 1)
-        text_surface, text_rect = square_font.render(letter, fg_color)
-        screen.window.blit(
-            text_surface,
-            (square_rect.left + square_rect.width / 2 - text_rect.width / 2,
-             square_rect.top + square_rect.height / 2 - text_rect.height / 2))
 
-    for row in range(3):
-        for column, letter in enumerate(rows[row]):
-            draw_character(row, column, letter)
+def paint_square(screen: Screen, row: int, column: int):
+    square = screen.grid[row][column]
+    text_color = get_square_color(square)
+    if square.status != Status.INACTIVE:
+        pygame.draw.rect(screen.surface, text_color, screen.layout.squares[row][column], 1)
+    screen.grid_glyphs.blit(screen.surface, square.letter, text_color,
+                            screen.layout.square_anchors[row][column])
 
 
-def draw_grid(screen: Screen):
-    square_size = 88 * screen.scale
-    screen_edge = 10 * screen.scale
-    hor_square_margin = 10 * screen.scale
-    ver_square_margin = 10 * screen.scale
-    font_size = 36 * screen.scale
-    square_font = pygame.freetype.SysFont("OCR-A Extended", font_size )
+def paint_key(screen: Screen, letter: str):
+    fg_color = get_letter_color(screen, letter)
+    rect = screen.layout.keys[letter]
+    screen.surface.fill(BG_COLOR, rect)
+    pygame.draw.rect(screen.surface, fg_color, rect, 1)
+    screen.key_glyphs.blit(screen.surface, letter, fg_color, screen.layout.key_anchors[letter])
 
-    screen.window.fill(BG_COLOR)
 
-    for row in range(6):
-        for column in range(5):
+def draw_square(screen: Screen, row: int, column: int) -> pygame.Rect:
+    rect = screen.layout.squares[row][column]
+    screen.surface.blit(screen.background, rect, rect)
+    paint_square(screen, row, column)
+    return rect
+
+
+def draw_key(screen: Screen, letter: str) -> pygame.Rect:
+    rect = screen.layout.keys[letter]
+    if screen.letters[letter] == Status.NOT_TESTED:
+        screen.surface.blit(screen.background, rect, rect)
+    else:
+        paint_key(screen, letter)
+    return rect
+
+
+def draw_caption(screen: Screen) -> pygame.Rect:
+    label_font = screen.fonts.get("Lucida Console", 22)
+    rect = screen.layout.caption_rect
+    anchor_x, anchor_y = screen.layout.caption_anchor
+
+    screen.surface.blit(screen.background, rect, rect)
+    text_surface, text_rect = screen.text_cache.render(label_font, screen.caption, NOT_TESTED_COLOR)
+    screen.surface.blit(text_surface, (anchor_x - text_rect.width / 2, anchor_y))
+    screen.drawn_caption = screen.caption
+    return rect
+
+
+def draw_debug_overlay(screen: Screen) -> pygame.Rect:
+    debug_font = screen.fonts.get("Lucida Console", 12)
+    origin_x, origin_y = screen.layout.debug_origin
+    rect = pygame.Rect(0, 0, 0, 0)
+    for i, text in enumerate(screen.debug.values()):
+        text_surface, _ = screen.text_cache.render(debug_font, text, NOT_TESTED_COLOR, BG_COLOR)
+        rect.union_ip(screen.surface.blit(
+            text_surface, (origin_x, origin_y + i * screen.layout.debug_line_height)))
+    return rect
+
+
+def scale_rect(rect: pygame.Rect, scale: float) -> pygame.Rect:
+    #Smoothing blends neighbouring pixels, so pad by one on each side.
+    left = int(rect.left * scale) - 1
+    top = int(rect.top * scale) - 1
+    right = math.ceil(rect.right * scale) + 1
+    bottom = math.ceil(rect.bottom * scale) + 1
+    return pygame.Rect(left, top, right - left, bottom - top)
+
+
+def present(screen: Screen, rects: list[pygame.Rect] = None):
+    if screen.surface is not screen.window:
+        size = screen.view_size
+        view = screen.window.subsurface(pygame.Rect((0, 0), size))
+        if screen.scale == int(screen.scale):
+            pygame.transform.scale(screen.surface, size, view)
+        else:
+            pygame.transform.smoothscale(screen.surface, size, view)
+        if rects is not None:
+            rects = [scale_rect(rect, screen.scale).clip(screen.window.get_rect()) for rect in rects]
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+
+def draw_dirty(screen: Screen):
+    rects = []
+    for row, column in screen.dirty_squares:
+        rects.append(draw_square(screen, row, column))
+    for letter in screen.dirty_keys:
+        rects.append(draw_key(screen, letter))
+    if screen.caption != screen.drawn_caption:
+        rects.append(draw_caption(screen))
+    if screen.show_debug and rects:
+        rects.append(draw_debug_overlay(screen))
+
+    screen.dirty_squares.clear()
+    screen.dirty_keys.clear()
+    if rects:
+        present(screen, rects)
+
+
+def draw_grid(screen: Screen):
+    screen.surface.blit(screen.background, (0, 0))
+
+    for row in range(layout.GRID_ROWS):
+        for column in range(layout.GRID_COLUMNS):
             square = screen.grid[row][column]
-            text_color = INACTIVE_COLOR
-
-            if square.status == Status.NOT_TESTED:
-                text_color = NOT_TESTED_COLOR
-            elif square.status == Status.INCORRECT:
-                text_color = INCORRECT_COLOR
-            elif square.status == Status.CORRECT:
-                text_color = CORRECT_COLOR
-            elif square.status == Status.WRONG_PLACE:
-                text_color = WRONG_PLACE_COLOR
-
-            square_rect = pygame.Rect(
-                column * (square_size + hor_square_margin) + screen_edge,
-                row * (square_size + ver_square_margin) + screen_edge,
-                square_size,
-                square_size)
-            pygame.draw.rect(screen.window, text_color, square_rect, 1)
-            text_surface, text_rect = square_font.render(square.letter, text_color, BG_COLOR)
-            screen.window.blit(
-                text_surface,
-                (square_rect.left + square_rect.width / 2 - text_rect.width / 2,
-                 square_rect.top + square_rect.height / 2 - text_rect.height / 2))
-
-    label_font = pygame.freetype.SysFont("Lucida Console", 22 * screen.scale)
-    text_surface, text_rect = label_font.render(screen.caption, NOT_TESTED_COLOR)
-    screen.window.blit(
-        text_surface,
-        (0 + screen.window.get_width() / 2 - text_rect.width / 2, 600 * screen.scale))
-
-    draw_keyboard(screen, 634 * screen.scale)
-
-    pygame.display.flip()
+            if square.status != Status.INACTIVE or square.letter != "":
+                paint_square(screen, row, column)
+
+    draw_caption(screen)
+
+    for letter in screen.layout.keys:
+        if screen.letters[letter] != Status.NOT_TESTED:
+            paint_key(screen, letter)
+
+    if screen.show_debug:
+        draw_debug_overlay(screen)
+
+    screen.dirty_squares.clear()
+    screen.dirty_keys.clear()
+    screen.full_redraw = False
+    present(screen)
+
+
+def render(screen: Screen):
+    if screen.full_redraw:
+        draw_grid(screen)
+    else:
+        draw_dirty(screen)
 
 
 def new_word(screen: Screen):
     word_number = randrange((len(words.WORDS) - 1))
-    screen.word = words.WORDS[word_number]
+    screen.game.new_game(words.WORDS[word_number])
 
 
-def run_game():    
+def create_dispatcher(screen: Screen) -> events.Event_Dispatcher:
+    dispatcher = events.Event_Dispatcher()
+    dispatcher.register(pygame.KEYDOWN, lambda event: handle_event(screen, event)) # pylint: disable=no-member
+    dispatcher.register(hints.HINT_READY, lambda event: handle_hint(screen, event))
+    dispatcher.register(pygame.VIDEORESIZE, lambda event: handle_resize(screen, event)) # pylint: disable=no-member
+    dispatcher.register(pygame.QUIT, lambda event: False) # pylint: disable=no-member
+    dispatcher.install()
+    return dispatcher
+
+
+def run_game(idle_wait: bool = True, wait_timeout: int = 0):
+    started_at = time.perf_counter()
     pygame.init() # pylint: disable=no-member
     pygame.display.set_caption("Five-letter Word Game")
 
     screen = Screen()
     clock = pygame.time.Clock()
+    dispatcher = create_dispatcher(screen)
     new_word(screen)
     running = True
     draw_grid(screen)
+    screen.debug["startup"] = f"first frame {(time.perf_counter() - started_at) * 1000:.1f} ms" + \
+                              (" (font scan)" if screen.fonts.resolver.scanned else "")
     while running:
-        for event in pygame.event.get(eventtype=pygame.KEYDOWN): # pylint: disable=no-member
-            handle_event(screen, event)
-        for event in pygame.event.get(eventtype=pygame.QUIT): # pylint: disable=no-member
-            running = False
+        #Sleep in SDL until something happens instead of polling every frame;
+        #a non-zero wait_timeout wakes the loop for animations.
+        if idle_wait:
+            timeout = wait_timeout
+            if screen.pending_size is not None:
+                #Only wait out what is left of the debounce window.
+                remaining = max(1, int((screen.resize_settles_at - time.perf_counter()) * 1000))
+                timeout = min(timeout, remaining) if timeout else remaining
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT: # pylint: disable=no-member
+                running = dispatcher.dispatch([event])
+        if running:
+            running = dispatcher.dispatch_pending()
+        settle_resize(screen)
+        screen.debug["events"] = "events " + \
+            " ".join(f"{name}={count}" for name, count in dispatcher.stats().items())
+        #All input queued this frame has been applied; paint the result once.
+        render(screen)
 
         clock.tick(60)
 
+    screen.hints.close()
+
 
 def main():
-    ctypes.windll.user32.SetProcessDPIAware()
+    if sys.platform == "win32":
+        ctypes.windll.user32.SetProcessDPIAware()
     run_game()
 
 
@@ -0,0 +1,277 @@
+"""Headless batch simulator: play answers from the word list against a guessing strategy.
+
+Each game runs through the real game.Game rules. Strategies only see the
+indices of the answers still consistent with the feedback so far, which
+the simulator narrows with rows of the memory-mapped feedback matrix.
+Answers can be fanned out across a process pool; workers map the same
+matrix file, so only answer indices and results cross process boundaries.
+
+Lockstep mode instead advances every game together: a games x words
+boolean matrix holds each game's remaining candidates, each turn gathers
+all feedback codes in one matrix lookup, and finished games are masked
+out of later turns.
+"""
+
+
+from abc import ABC, abstractmethod
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import time
+
+import numpy as np
+
+import dictionary
+import feedback
+import feedback_matrix
+import game
+import solver
+import words
+
+
+MAX_GUESSES = 6
+#Answers are played in fixed-size chunks, each with its own random stream,
+#so a seeded run gives the same results on any number of workers.
+ANSWERS_PER_CHUNK = 64
+
+
+class Strategy(ABC):
+    def __init__(self, seed: int = 0):
+        self.reseed(seed)
+
+    def reseed(self, seed: int):
+        self.seed = seed
+
+    def reset(self):
+        pass
+
+    @abstractmethod
+    def choose(self, candidate_indices: np.ndarray, turn: int) -> int:
+        pass
+
+    def choose_batch(self, remaining: np.ndarray, turn: int) -> np.ndarray:
+        #Games that have seen the same feedback share a candidate row, so
+        #choose() only runs once per distinct row.
+        rows, inverse = np.unique(np.packbits(remaining, axis=1), axis=0, return_inverse=True)
+        choices = np.empty(len(rows), dtype=np.intp)
+        for group, row in enumerate(rows):
+            candidate_indices = np.flatnonzero(np.unpackbits(row, count=remaining.shape[1]))
+            choices[group] = self.choose(candidate_indices, turn)
+        return choices[inverse.ravel()]
+
+
+class First_Candidate(Strategy):
+    def choose(self, candidate_indices: np.ndarray, turn: int) -> int:
+        return int(candidate_indices[0])
+
+    def choose_batch(self, remaining: np.ndarray, turn: int) -> np.ndarray:
+        return remaining.argmax(axis=1)
+
+
+class Random_Candidate(Strategy):
+    def reseed(self, seed: int):
+        super().reseed(seed)
+        self.random = random.Random(seed)
+        self.generator = np.random.default_rng(seed)
+
+    def choose(self, candidate_indices: np.ndarray, turn: int) -> int:
+        return int(candidate_indices[self.random.randrange(len(candidate_indices))])
+
+    def choose_batch(self, remaining: np.ndarray, turn: int) -> np.ndarray:
+        picks = (self.generator.random(len(remaining)) * remaining.sum(axis=1)).astype(np.int32)
+        seen = np.cumsum(remaining, axis=1, dtype=np.int32)
+        return (seen > picks[:, None]).argmax(axis=1)
+
+
+class Entropy(Strategy):
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.solver = solver.Solver(workers=1)
+        self.opener = None
+
+    def choose(self, candidate_indices: np.ndarray, turn: int) -> int:
+        if len(candidate_indices) <= 2:
+            return int(candidate_indices[0])
+        #Every game starts from the full list, so the opener is worked out once.
+        if turn == 0 and self.opener is not None:
+            return self.opener
+        word, _ = self.solver.rank(candidate_indices, 1)[0]
+        choice = dictionary.INDEX.index(word)
+        if turn == 0:
+            self.opener = choice
+        return choice
+
+
+class With_Opener(Strategy):
+    def __init__(self, opener: str, strategy: Strategy):
+        if opener.lower() not in dictionary.INDEX:
+            raise ValueError(f"opener {opener!r} is not in the word list")
+        self.opener = dictionary.INDEX.index(opener.lower())
+        self.strategy = strategy
+        super().__init__(strategy.seed)
+
+    def reseed(self, seed: int):
+        super().reseed(seed)
+        self.strategy.reseed(seed)
+
+    def reset(self):
+        self.strategy.reset()
+
+    def choose(self, candidate_indices: np.ndarray, turn: int) -> int:
+        if turn == 0:
+            return self.opener
+        return self.strategy.choose(candidate_indices, turn)
+
+    def choose_batch(self, remaining: np.ndarray, turn: int) -> np.ndarray:
+        if turn == 0:
+            return np.full(len(remaining), self.opener, dtype=np.intp)
+        return self.strategy.choose_batch(remaining, turn)
+
+
+STRATEGIES = {"first": First_Candidate, "random": Random_Candidate, "entropy": Entropy}
+
+
+def make_strategy(name, opener: str = None, seed: int = 0) -> Strategy:
+    strategy = STRATEGIES[name](seed) if isinstance(name, str) else name(seed)
+    if opener:
+        strategy = With_Opener(opener, strategy)
+    return strategy
+
+
+def play_game(engine: game.Game, codes: np.ndarray, strategy: Strategy, answer_index: int) -> int:
+    word_list = words.WORDS
+    engine.new_game(word_list[answer_index])
+    strategy.reset()
+    remaining = np.arange(len(word_list))
+    for turn in range(MAX_GUESSES):
+        guess_index = strategy.choose(remaining, turn)
+        for letter in word_list[guess_index]:
+            engine.type_letter(letter)
+        engine.submit()
+        if engine.state == game.Game_State.OUT_OF_GAME:
+            return turn + 1 if engine.is_won() else 0
+        guess_row = codes[guess_index]
+        remaining = remaining[guess_row[remaining] == guess_row[answer_index]]
+    return 0
+
+
+def play_answers(codes: np.ndarray, strategy: Strategy, answer_indices) -> list[int]:
+    engine = game.Game()
+    return [play_game(engine, codes, strategy, int(answer_index)) for answer_index in answer_indices]
+
+
+def play_lockstep(codes: np.ndarray, strategy: Strategy, answer_indices: np.ndarray) -> np.ndarray:
+    size = codes.shape[0]
+    answer_indices = np.asarray(answer_indices, dtype=np.intp)
+    results = np.zeros(len(answer_indices), dtype=np.int8)
+    remaining = np.ones((len(answer_indices), size), dtype=bool)
+    active = np.arange(len(answer_indices))
+    strategy.reset()
+    for turn in range(MAX_GUESSES):
+        if len(active) == 0:
+            break
+        guesses = np.asarray(strategy.choose_batch(remaining, turn), dtype=np.intp)
+        guess_rows = codes[guesses]
+        answer_codes = guess_rows[np.arange(len(active)), answer_indices[active]]
+        won = answer_codes == feedback.ALL_CORRECT
+        results[active[won]] = turn + 1
+        #Only games still going carry their candidate rows into the next turn.
+        playing = ~won
+        active = active[playing]
+        remaining = remaining[playing] & (guess_rows[playing] == answer_codes[playing, None])
+    return results
+
+
+def play_chunks(codes: np.ndarray, strategy: Strategy, chunks, seeds) -> list[int]:
+    results = []
+    for chunk, chunk_seed in zip(chunks, seeds):
+        strategy.reseed(chunk_seed)
+        results += play_answers(codes, strategy, chunk)
+    return results
+
+
+_worker_strategies = {}
+
+
+def _worker_play(strategy_name, opener: str, seed: int, answer_indices: np.ndarray) -> list[int]:
+    #Strategies live as long as the worker, so setup such as an entropy
+    #opener is paid once per process rather than once per chunk.
+    strategy = _worker_strategies.get((strategy_name, opener))
+    if strategy is None:
+        strategy = _worker_strategies[(strategy_name, opener)] = make_strategy(strategy_name, opener)
+    return play_chunks(solver.worker_codes(), strategy, [answer_indices], [seed])
+
+
+def strategy_seeds(seed: int, count: int) -> list[int]:
+    #Independent streams derived from the run seed, one per chunk of answers.
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
+
+
+def simulate(strategy_name="first", opener: str = None, sample: int = None,
+             seed: int = 0, workers: int = 1, lockstep: bool = False) -> dict:
+    word_list = words.WORDS
+    size = len(word_list)
+    path = feedback_matrix.matrix_path(word_list)
+    feedback_matrix.load(word_list, path)
+
+    answer_indices = np.arange(size)
+    if sample is not None and sample < size:
+        answer_indices = np.sort(np.random.default_rng(seed).choice(size, sample, replace=False))
+
+    started_at = time.perf_counter()
+    chunks = np.array_split(answer_indices, max(1, -(-len(answer_indices) // ANSWERS_PER_CHUNK)))
+    seeds = strategy_seeds(seed, len(chunks))
+    if lockstep:
+        results = play_lockstep(solver.open_codes(path, size),
+                                make_strategy(strategy_name, opener, seeds[0]), answer_indices).tolist()
+    elif workers <= 1:
+        results = play_chunks(solver.open_codes(path, size),
+                              make_strategy(strategy_name, opener), chunks, seeds)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=solver.init_worker,
+                                 initargs=(path, size)) as executor:
+            futures = [executor.submit(_worker_play, strategy_name, opener, chunk_seed, chunk)
+                       for chunk, chunk_seed in zip(chunks, seeds) if len(chunk)]
+            results = [result for future in futures for result in future.result()]
+    elapsed = time.perf_counter() - started_at
+
+    distribution = {str(guesses): results.count(guesses) for guesses in range(1, MAX_GUESSES + 1)}
+    distribution["X"] = results.count(0)
+    wins = len(results) - distribution["X"]
+    return {"strategy": strategy_name if isinstance(strategy_name, str) else strategy_name.__name__,
+            "opener": opener,
+            "games": len(results),
+            "wins": wins,
+            "win_rate": wins / len(results) if results else 0.0,
+            "mean_guesses": sum(results) / wins if wins else 0.0,
+            "distribution": distribution,
+            "seconds": elapsed,
+            "games_per_second": len(results) / elapsed if elapsed else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="first")
+    parser.add_argument("--opener", help="fixed first guess")
+    parser.add_argument("--sample", type=int, help="play this many random answers instead of all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--lockstep", action="store_true",
+                        help="advance all games together in NumPy arrays instead of one at a time")
+    args = parser.parse_args()
+    if args.opener and args.opener.lower() not in dictionary.INDEX:
+        parser.error(f"opener {args.opener!r} is not in the word list")
+
+    report = simulate(args.strategy, args.opener, args.sample, args.seed, args.workers, args.lockstep)
+    print(f"{report['strategy']}" + (f" opening {args.opener.upper()}" if args.opener else "") +
+          f": {report['wins']}/{report['games']} won ({report['win_rate']:.2%}), " +
+          f"{report['mean_guesses']:.3f} guesses per win")
+    for guesses, count in report["distribution"].items():
+        print(f"  {guesses}: {count}")
+    print(f"{report['games_per_second']:.0f} games/s over {report['seconds']:.2f} s " +
+          ("in lockstep" if args.lockstep else f"on {args.workers} workers"))
+
+
+if __name__ == "__main__":
+    main()
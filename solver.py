@@ -0,0 +1,163 @@
+"""Best-guess recommender ranking guesses by the entropy of their feedback partition.
+
+Scoring reads codes out of the memory-mapped feedback matrix. Large
+rankings are split into guess blocks across a process pool; each worker
+maps the same matrix file once in its initializer, so the word data is
+shared read-only through the page cache and tasks only carry block
+bounds and the candidate indices.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+
+import numpy as np
+
+import candidates
+import feedback
+import feedback_matrix
+import words
+
+
+#Below this many guess x candidate cells a ranking runs in-process.
+PARALLEL_THRESHOLD = 1_000_000
+BLOCKS_PER_WORKER = 4
+
+_worker_codes = None
+
+
+def open_codes(path: str, size: int) -> np.ndarray:
+    return np.memmap(path, dtype=np.uint8, mode="r", shape=(size, size))
+
+
+def to_indices(candidate_indices) -> np.ndarray:
+    if isinstance(candidate_indices, candidates.Candidate_Set):
+        candidate_indices = list(candidate_indices.indices())
+    return np.asarray(candidate_indices, dtype=np.intp)
+
+
+def sorted_entropies(block: np.ndarray) -> np.ndarray:
+    rows, count = block.shape
+    ordered = np.sort(block, axis=1)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    run_starts = np.flatnonzero(starts.ravel())
+    lengths = np.diff(np.append(run_starts, ordered.size))
+    probabilities = lengths / count
+    return 0.0 - np.bincount(run_starts // count, weights=probabilities * np.log2(probabilities),
+                             minlength=rows)
+
+
+def block_entropies(codes: np.ndarray, start: int, stop: int,
+                    candidate_indices: np.ndarray) -> np.ndarray:
+    block = codes[start:stop][:, candidate_indices]
+    rows = stop - start
+    #With fewer candidates than codes most count cells would be empty, so
+    #measuring runs in each sorted row beats zeroing a rows x 243 table.
+    if len(candidate_indices) < feedback.CODE_COUNT:
+        return sorted_entropies(block)
+    offsets = block.astype(np.intp) + (np.arange(rows) * feedback.CODE_COUNT)[:, None]
+    counts = np.bincount(offsets.ravel(), minlength=rows * feedback.CODE_COUNT)
+    counts = counts.reshape(rows, feedback.CODE_COUNT)
+    probabilities = counts / len(candidate_indices)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(counts > 0, probabilities * np.log2(probabilities), 0.0)
+    return 0.0 - terms.sum(axis=1)
+
+
+def init_worker(path: str, size: int):
+    #Pool initializer: map the matrix once per worker process.
+    global _worker_codes # pylint: disable=global-statement
+    _worker_codes = open_codes(path, size)
+
+
+def worker_codes() -> np.ndarray:
+    return _worker_codes
+
+
+def _worker_entropies(start: int, stop: int, candidate_indices: np.ndarray) -> np.ndarray:
+    return block_entropies(_worker_codes, start, stop, candidate_indices)
+
+
+class Solver:
+    def __init__(self, workers: int = None):
+        self.word_list = words.WORDS
+        self.size = len(self.word_list)
+        self.path = feedback_matrix.matrix_path(self.word_list)
+        feedback_matrix.load(self.word_list, self.path)
+        self.codes = open_codes(self.path, self.size)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.executor = None
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def pool(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                initializer=init_worker,
+                                                initargs=(self.path, self.size))
+        return self.executor
+
+    def candidate_indices(self, history) -> np.ndarray:
+        remaining = np.ones(self.size, dtype=bool)
+        for guess, code in history:
+            remaining &= self.codes[self.word_list.index(guess.lower())] == code
+        return np.flatnonzero(remaining)
+
+    def entropies(self, candidate_indices, should_stop=None) -> np.ndarray:
+        candidate_indices = to_indices(candidate_indices)
+        result = np.zeros(self.size)
+        if len(candidate_indices) == 0:
+            return result
+
+        if self.workers <= 1 or self.size * len(candidate_indices) < PARALLEL_THRESHOLD:
+            return block_entropies(self.codes, 0, self.size, candidate_indices)
+
+        block_size = -(-self.size // (self.workers * BLOCKS_PER_WORKER))
+        futures = {}
+        for start in range(0, self.size, block_size):
+            stop = min(start + block_size, self.size)
+            future = self.pool().submit(_worker_entropies, start, stop, candidate_indices)
+            futures[future] = (start, stop)
+        for future, (start, stop) in futures.items():
+            if should_stop is not None and should_stop():
+                for pending in futures:
+                    pending.cancel()
+                return None
+            result[start:stop] = future.result()
+        return result
+
+    def rank(self, candidate_indices, k: int = 10, should_stop=None) -> list[tuple[str, float]]:
+        candidate_indices = to_indices(candidate_indices)
+        entropies = self.entropies(candidate_indices, should_stop)
+        if entropies is None:
+            return None
+
+        #Best entropy first; ties go to guesses that could still be the answer.
+        is_candidate = np.zeros(self.size, dtype=bool)
+        is_candidate[candidate_indices] = True
+        order = np.lexsort((np.arange(self.size), ~is_candidate, -entropies))
+        return [(self.word_list[index], float(entropies[index])) for index in order[:k]]
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    solver = Solver()
+    try:
+        start = time.perf_counter()
+        ranking = solver.rank(range(solver.size), top)
+        elapsed = time.perf_counter() - start
+    finally:
+        solver.close()
+    for word, entropy in ranking:
+        print(f"{word.upper()}  {entropy:.4f} bits")
+    print(f"Ranked {solver.size} guesses on {solver.workers} workers in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Where generated cache files live, and how they are written safely.
+
+Caches sit next to the sources. Writers go through write_atomic so that
+several processes building the same file at once each replace it whole.
+"""
+
+
+import os
+import tempfile
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def write_atomic(path: str, data: bytes):
+    #Each writer gets its own temp file, so processes racing to build the
+    #same file on a cold start each replace it whole instead of colliding.
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                         prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
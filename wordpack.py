@@ -0,0 +1,93 @@
+"""Packed binary word list: fixed-width 5-byte ASCII records, memory-mapped on load."""
+
+
+from collections.abc import Sequence
+import mmap
+import os
+import sys
+
+import storage
+
+
+WORD_LENGTH = 5
+SOURCE_PATH = os.path.join(storage.BASE_DIR, "words.txt")
+PACK_PATH = os.path.join(storage.BASE_DIR, "words.bin")
+
+
+class Word_Pack(Sequence):
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data) // WORD_LENGTH
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError("word pack index out of range")
+        start = index * WORD_LENGTH
+        return self.data[start:start + WORD_LENGTH].decode("ascii")
+
+    def __iter__(self):
+        data = self.data
+        for start in range(0, self.count * WORD_LENGTH, WORD_LENGTH):
+            yield data[start:start + WORD_LENGTH].decode("ascii")
+
+    def __contains__(self, word) -> bool:
+        return self.find(word) >= 0
+
+    def find(self, word: str) -> int:
+        #Shorter needles would match prefixes of aligned records.
+        if not isinstance(word, str) or len(word) != WORD_LENGTH:
+            return -1
+        needle = word.encode("ascii", "replace")
+        position = self.data.find(needle)
+        #Matches can straddle two records, so only accept aligned ones:
+        while position >= 0 and position % WORD_LENGTH != 0:
+            position = self.data.find(needle, position + 1)
+        return position // WORD_LENGTH if position >= 0 else -1
+
+    def index(self, word):
+        position = self.find(word)
+        if position < 0:
+            raise ValueError(f"{word!r} is not in word pack")
+        return position
+
+
+def read_source(source: str = SOURCE_PATH) -> list[str]:
+    with open(source, encoding="ascii") as source_file:
+        word_list = [line.strip().lower() for line in source_file if line.strip()]
+    for word in word_list:
+        if len(word) != WORD_LENGTH or not word.isalpha():
+            raise ValueError(f"invalid word in {source}: {word!r}")
+    return word_list
+
+
+def build(source: str = SOURCE_PATH, target: str = PACK_PATH) -> int:
+    word_list = read_source(source)
+    storage.write_atomic(target, "".join(word_list).encode("ascii"))
+    return len(word_list)
+
+
+def is_stale(source: str = SOURCE_PATH, target: str = PACK_PATH) -> bool:
+    if not os.path.exists(target):
+        return True
+    return os.path.exists(source) and os.path.getmtime(source) > os.path.getmtime(target)
+
+
+def load(source: str = SOURCE_PATH, target: str = PACK_PATH) -> Word_Pack:
+    if is_stale(source, target):
+        build(source, target)
+    with open(target, "rb") as pack_file:
+        data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return Word_Pack(data)
+
+
+if __name__ == "__main__":
+    source_path = sys.argv[1] if len(sys.argv) > 1 else SOURCE_PATH
+    target_path = sys.argv[2] if len(sys.argv) > 2 else PACK_PATH
+    print(f"Packed {build(source_path, target_path)} words into {target_path}")